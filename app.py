@@ -3,6 +3,7 @@ from flask_jwt_extended import JWTManager, jwt_required
 from config import JWT_SECRET_KEY
 from flask_cors import CORS
 from auth import auth_bp
+from cli import claims_cli
 from policyholders import create_policyholder, get_policyholders, update_policyholder, delete_policyholder
 from policies import create_policy, get_policies, update_policy, delete_policy
 from claims import create_claim, get_claims, update_claim, delete_claim
@@ -40,6 +41,9 @@ jwt = JWTManager(app)
 # Register authentication routes
 app.register_blueprint(auth_bp)
 
+# Register bulk import/export commands (flask claims import/export)
+app.cli.add_command(claims_cli)
+
 # ------------------------ ROUTES ------------------------
 @app.route('/')
 def home():
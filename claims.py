@@ -2,6 +2,30 @@ from flask import request, jsonify
 from flasgger import Swagger
 from flasgger import swag_from
 from models import claims_collection, policies_collection, policyholders_collection
+from singleflight import single_flight
+
+# ------------------------ VALIDATION ------------------------
+
+def validate_claim(data):
+    # Validate that claim_id, policy_id, policyholder_id, and amount are numbers
+    if not isinstance(data.get("claim_id"), int):
+        return "Claim ID must be a number"
+
+    if not isinstance(data.get("policy_id"), int):
+        return "Policy ID must be a number"
+
+    if not isinstance(data.get("policyholder_id"), int):
+        return "Policyholder ID must be a number"
+
+    if not isinstance(data.get("amount"), (int, float)):
+        return "Amount must be a number"
+
+    # Validate that status contains only alphabets
+    status = data.get("status")
+    if not isinstance(status, str) or not status.isalpha():
+        return "Status must contain only alphabets"
+
+    return None
 
 # ------------------------ CLAIMS CRUD ------------------------
 
@@ -43,23 +67,10 @@ def create_claim():
     #if amount < 0:
         #return jsonify({"error": "Claim amount cannot be negative"}), 400
 
-    # Validate that claim_id, policy_id, policyholder_id, and amount are numbers
-    if not isinstance(claim_id, int):
-        return jsonify({"error": "Claim ID must be a number"}), 400
-
-    if not isinstance(policy_id, int):
-        return jsonify({"error": "Policy ID must be a number"}), 400
-
-    if not isinstance(policyholder_id, int):
-        return jsonify({"error": "Policyholder ID must be a number"}), 400
+    error = validate_claim(data)
+    if error:
+        return jsonify({"error": error}), 400
 
-    if not isinstance(amount, (int, float)):
-        return jsonify({"error": "Amount must be a number"}), 400
-
-    # Validate that status contains only alphabets
-    if not status.isalpha():
-        return jsonify({"error": "Status must contain only alphabets"}), 400
-        
     # Ensure policy exists
     policy = policies_collection.find_one({"policy_id": policy_id})
     if not policy:
@@ -113,6 +124,7 @@ def create_claim():
     }
 })
 
+@single_flight(params=())
 def get_claims():
     claims = list(claims_collection.find({}, {"_id": 0}))
     for claim in claims:
@@ -162,20 +174,10 @@ def update_claim(claim_id):
     policy_id = data.get("policy_id")
     policyholder_id = data.get("policyholder_id")
 
-    # Validate that claim_id, policy_id, policyholder_id, and amount are numbers
-    if not isinstance(amount, (int, float)):
-        return jsonify({"error": "Amount must be a number"}), 400
-
-    if not isinstance(policy_id, int):
-        return jsonify({"error": "Policy ID must be a number"}), 400
+    error = validate_claim({**data, "claim_id": claim_id})
+    if error:
+        return jsonify({"error": error}), 400
 
-    if not isinstance(policyholder_id, int):
-        return jsonify({"error": "Policyholder ID must be a number"}), 400
-
-    # Validate that status contains only alphabets
-    if not status.isalpha():
-        return jsonify({"error": "Status must contain only alphabets"}), 400
-        
     # Ensure claim exists
     claim = claims_collection.find_one({"claim_id": claim_id})
     if not claim:
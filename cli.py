@@ -0,0 +1,304 @@
+import codecs
+import csv
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import click
+from flask.cli import AppGroup
+from pymongo.errors import BulkWriteError
+from models import claims_collection, policies_collection, policyholders_collection
+from policyholders import validate_policyholder
+from policies import validate_policy
+from claims import validate_claim
+
+# ------------------------ BULK IMPORT / EXPORT ------------------------
+# Usage (point MONGO_URI at the target, e.g. mongodb://localhost:27017):
+#   flask --app app claims import policyholders policyholders.csv --workers 4
+#   flask --app app claims export claims claims.ndjson
+# Import policyholders before policies, and policies before claims, so that
+# references resolve. Files hold one record per line (NDJSON, or CSV with a
+# header row and no embedded newlines) so they can be split into byte ranges.
+
+claims_cli = AppGroup('claims', help='Bulk import and export of claims data.')
+
+RESOURCES = {
+    "policyholders": {
+        "collection": policyholders_collection,
+        "id": "policyholder_id",
+        "label": "Policyholder",
+        "validate": validate_policyholder,
+        "fields": {"policyholder_id": int, "name": str},
+        "refs": {}
+    },
+    "policies": {
+        "collection": policies_collection,
+        "id": "policy_id",
+        "label": "Policy",
+        "validate": validate_policy,
+        "fields": {"policy_id": int, "type": str, "amount": float, "policyholder_id": int},
+        "refs": {"policyholder_id": "policyholders"}
+    },
+    "claims": {
+        "collection": claims_collection,
+        "id": "claim_id",
+        "label": "Claim",
+        "validate": validate_claim,
+        "fields": {"claim_id": int, "amount": float, "status": str, "policy_id": int, "policyholder_id": int},
+        "refs": {"policy_id": "policies", "policyholder_id": "policyholders"}
+    }
+}
+
+
+def _detect_format(path, fmt):
+    if fmt:
+        return fmt
+    return "csv" if path.lower().endswith(".csv") else "ndjson"
+
+
+def _load_ids(name):
+    resource = RESOURCES[name]
+    id_field = resource["id"]
+    return {doc[id_field] for doc in resource["collection"].find({}, {"_id": 0, id_field: 1}) if id_field in doc}
+
+
+def _convert(value, kind):
+    # CSV values arrive as strings; convert them so the handler rules apply as-is
+    if value == "":
+        return None
+    if kind is str:
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    if kind is float:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _split_ranges(path, data_start, workers):
+    # Split the file into byte ranges that start on line boundaries
+    size = os.path.getsize(path)
+    bounds = [data_start]
+    with open(path, "rb") as f:
+        for k in range(1, workers):
+            target = data_start + (size - data_start) * k // workers
+            if target <= bounds[-1]:
+                continue
+            f.seek(target - 1)
+            f.readline()
+            if bounds[-1] < f.tell() < size:
+                bounds.append(f.tell())
+    bounds.append(size)
+    return [[start, start, end] for start, end in zip(bounds, bounds[1:])]
+
+
+class _Importer:
+    def __init__(self, name, path, fmt, header, chunk_size, checkpoint_path, ranges):
+        self.resource = RESOURCES[name]
+        self.name = name
+        self.path = path
+        self.fmt = fmt
+        self.header = header
+        self.chunk_size = chunk_size
+        self.checkpoint_path = checkpoint_path
+        self.ranges = ranges
+        self.lock = threading.Lock()
+        self.stop = threading.Event()
+        self.inserted = 0
+        self.rejected = 0
+        self.started = time.time()
+
+        # Reference and uniqueness checks run against ID sets loaded once
+        self.ids = _load_ids(name)
+        self.ref_ids = {ref: _load_ids(ref) for ref in set(self.resource["refs"].values())}
+
+    def _parse(self, line):
+        text = line.decode("utf-8")
+        if self.fmt == "csv":
+            values = next(csv.reader([text]))
+            fields = self.resource["fields"]
+            return {key: _convert(value, fields.get(key, str)) for key, value in zip(self.header, values)}
+        data = json.loads(text)
+        if not isinstance(data, dict):
+            raise ValueError("Record must be an object")
+        return data
+
+    def _check(self, data):
+        error = self.resource["validate"](data)
+        if error:
+            return error
+
+        for field, ref in self.resource["refs"].items():
+            if data[field] not in self.ref_ids[ref]:
+                return f"{RESOURCES[ref]['label']} not found"
+
+        record_id = data[self.resource["id"]]
+        with self.lock:
+            if record_id in self.ids:
+                return f"{self.resource['label']} with this ID already exists"
+            self.ids.add(record_id)
+        return None
+
+    def _save_checkpoint(self):
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"resource": self.name, "format": self.fmt, "ranges": self.ranges}, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _flush(self, index, batch, offset):
+        docs = []
+        rejected = 0
+        for line_offset, line in batch:
+            try:
+                data = self._parse(line)
+                error = self._check(data)
+            except ValueError as e:
+                error = f"Invalid record: {e}"
+            if error:
+                rejected += 1
+                click.echo(f"{self.path}@{line_offset}: {error}", err=True)
+                continue
+            docs.append({field: data.get(field) for field in self.resource["fields"]})
+
+        inserted = len(docs)
+        if docs:
+            try:
+                self.resource["collection"].insert_many(docs, ordered=False)
+            except BulkWriteError as e:
+                write_errors = e.details.get("writeErrors", [])
+                inserted -= len(write_errors)
+                rejected += len(write_errors)
+                for write_error in write_errors:
+                    click.echo(f"{self.path}: {write_error.get('errmsg')}", err=True)
+
+        with self.lock:
+            self.inserted += inserted
+            self.rejected += rejected
+            self.ranges[index][1] = offset
+            self._save_checkpoint()
+            click.echo(f"{self.inserted} inserted, {self.rejected} rejected ({self.rate():.0f} rows/s)")
+
+    def rate(self):
+        elapsed = time.time() - self.started
+        return (self.inserted + self.rejected) / elapsed if elapsed > 0 else 0.0
+
+    def run_range(self, index):
+        _, position, end = self.ranges[index]
+        batch = []
+        with open(self.path, "rb") as f:
+            f.seek(position)
+            # Stop at a chunk boundary once asked, leaving the checkpoint at the last flush
+            while f.tell() < end and not self.stop.is_set():
+                line_offset = f.tell()
+                line = f.readline()
+                if not line:
+                    break
+                if line.strip():
+                    batch.append((line_offset, line))
+                if len(batch) >= self.chunk_size:
+                    self._flush(index, batch, f.tell())
+                    batch = []
+            if not self.stop.is_set():
+                self._flush(index, batch, f.tell())
+
+
+@claims_cli.command('import')
+@click.argument('resource', type=click.Choice(list(RESOURCES)))
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(['csv', 'ndjson']), help='Defaults to the file extension.')
+@click.option('--chunk-size', default=1000, show_default=True, help='Records per insert_many call.')
+@click.option('--workers', default=1, show_default=True, help='Parallel workers over file ranges.')
+@click.option('--checkpoint', 'checkpoint_path', help='Checkpoint file (defaults to PATH.checkpoint).')
+@click.option('--resume', is_flag=True, help='Continue from an existing checkpoint.')
+def import_command(resource, path, fmt, chunk_size, workers, checkpoint_path, resume):
+    """Import RESOURCE records from a CSV or NDJSON file."""
+    fmt = _detect_format(path, fmt)
+    checkpoint_path = checkpoint_path or path + ".checkpoint"
+
+    # Skip a leading UTF-8 BOM (Excel writes one) so it never reaches a record
+    header = None
+    with open(path, "rb") as f:
+        data_start = len(codecs.BOM_UTF8) if f.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8 else 0
+        if fmt == "csv":
+            f.seek(data_start)
+            header_line = f.readline()
+            header = [name.strip() for name in next(csv.reader([header_line.decode("utf-8")]), [])]
+            data_start += len(header_line)
+
+    if resume and os.path.exists(checkpoint_path):
+        with open(checkpoint_path, encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("resource") != resource or checkpoint.get("format") != fmt:
+            raise click.ClickException("Checkpoint was written for a different resource or format")
+        ranges = checkpoint["ranges"]
+        click.echo(f"Resuming from {checkpoint_path}")
+    else:
+        ranges = _split_ranges(path, data_start, max(workers, 1))
+
+    importer = _Importer(resource, path, fmt, header, max(chunk_size, 1), checkpoint_path, ranges)
+    executor = ThreadPoolExecutor(max_workers=len(ranges) or 1)
+    futures = [executor.submit(importer.run_range, index) for index in range(len(ranges))]
+    try:
+        for future in as_completed(futures):
+            future.result()
+    except BaseException:
+        # Ctrl-C or a failed worker: let the others finish their current chunk
+        importer.stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+        click.echo(f"Stopped; rerun with --resume to continue from {checkpoint_path}", err=True)
+        raise
+    executor.shutdown()
+
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    click.echo(f"Done: {importer.inserted} inserted, {importer.rejected} rejected "
+               f"in {time.time() - importer.started:.1f}s ({importer.rate():.0f} rows/s)")
+
+
+@claims_cli.command('export')
+@click.argument('resource', type=click.Choice(list(RESOURCES)))
+@click.argument('path', type=click.Path(dir_okay=False, writable=True))
+@click.option('--format', 'fmt', type=click.Choice(['csv', 'ndjson']), help='Defaults to the file extension.')
+@click.option('--chunk-size', default=1000, show_default=True, help='Records fetched and written per batch.')
+def export_command(resource, path, fmt, chunk_size):
+    """Export RESOURCE records to a CSV or NDJSON file."""
+    fmt = _detect_format(path, fmt)
+    fields = list(RESOURCES[resource]["fields"])
+    chunk_size = max(chunk_size, 1)
+    started = time.time()
+    count = 0
+
+    cursor = RESOURCES[resource]["collection"].find({}, {"_id": 0}).batch_size(chunk_size)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = None
+        if fmt == "csv":
+            writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+            writer.writeheader()
+
+        batch = []
+        for doc in cursor:
+            batch.append(doc)
+            if len(batch) < chunk_size:
+                continue
+            _write_batch(f, writer, batch)
+            count += len(batch)
+            batch = []
+        _write_batch(f, writer, batch)
+        count += len(batch)
+
+    elapsed = time.time() - started
+    rate = count / elapsed if elapsed > 0 else 0.0
+    click.echo(f"Done: {count} exported in {elapsed:.1f}s ({rate:.0f} rows/s)")
+
+
+def _write_batch(f, writer, batch):
+    if writer:
+        writer.writerows(batch)
+    else:
+        f.write("".join(json.dumps(doc, default=str) + "\n" for doc in batch))
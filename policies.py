@@ -2,6 +2,27 @@ from flask import request, jsonify
 from flasgger import Swagger
 from flasgger import swag_from
 from models import policies_collection, policyholders_collection
+from singleflight import single_flight
+
+# ------------------------ VALIDATION ------------------------
+
+def validate_policy(data):
+    # Validate that policy_id, policyholder_id, and amount are numbers
+    if not isinstance(data.get("policy_id"), int):
+        return "Policy ID must be a number"
+
+    if not isinstance(data.get("policyholder_id"), int):
+        return "Policyholder ID must be a number"
+
+    if not isinstance(data.get("amount"), (int, float)):
+        return "Amount must be a number"
+
+    # Validate that type contains only letters
+    type = data.get("type")
+    if not isinstance(type, str) or not type.isalpha():
+        return "Policy type must contain only letters"
+
+    return None
 
 # ------------------------ POLICY CRUD ------------------------
 @swag_from({
@@ -36,20 +57,10 @@ def create_policy():
     amount = data.get("amount")
     policyholder_id = data.get("policyholder_id")
 
-    # Validate that policy_id, policyholder_id, and amount are numbers
-    if not isinstance(policy_id, int):
-        return jsonify({"error": "Policy ID must be a number"}), 400
-
-    if not isinstance(policyholder_id, int):
-        return jsonify({"error": "Policyholder ID must be a number"}), 400
-
-    if not isinstance(amount, (int, float)):
-        return jsonify({"error": "Amount must be a number"}), 400
+    error = validate_policy(data)
+    if error:
+        return jsonify({"error": error}), 400
 
-    # Validate that type contains only letters
-    if not type.isalpha():
-        return jsonify({"error": "Policy type must contain only letters"}), 400
-        
     # Ensure policyholder exists
     policyholder = policyholders_collection.find_one({"policyholder_id": policyholder_id})
     if not policyholder:
@@ -92,6 +103,7 @@ def create_policy():
     }
 })
 
+@single_flight(params=())
 def get_policies():
     policies = list(policies_collection.find({}, {"_id": 0}))
     for policy in policies:
@@ -135,17 +147,10 @@ def update_policy(policy_id):
     amount = data.get("amount")
     policyholder_id = data.get("policyholder_id")
 
-    # Validate that type contains only letters
-    if not type.isalpha():
-        return jsonify({"error": "Policy type must contain only letters"}), 400
-
-    # Validate that policyholder_id and amount are numbers
-    if not isinstance(policyholder_id, int):
-        return jsonify({"error": "Policyholder ID must be a number"}), 400
+    error = validate_policy({**data, "policy_id": policy_id})
+    if error:
+        return jsonify({"error": error}), 400
 
-    if not isinstance(amount, (int, float)):
-        return jsonify({"error": "Amount must be a number"}), 400
-        
     # Ensure policy exists
     policy = policies_collection.find_one({"policy_id": policy_id})
     if not policy:
@@ -4,6 +4,20 @@ from flasgger import swag_from
 from models import policyholders_collection
 
 
+# ------------------------ VALIDATION ------------------------
+
+def validate_policyholder(data):
+    # Validate that policyholder_id is a number
+    if not isinstance(data.get("policyholder_id"), int):
+        return "Policyholder ID must be a number"
+
+    # Validate that name contains only letters
+    name = data.get("name")
+    if not isinstance(name, str) or not name.isalpha():
+        return "Name must contain only letters"
+
+    return None
+
 # ------------------------ POLICYHOLDER CRUD ------------------------
 @swag_from({
     'tags': ['Policyholders'],
@@ -33,13 +47,10 @@ def create_policyholder():
     data = request.json
     policyholder_id = data.get("policyholder_id")
     name = data.get("name")
-# Validate that policyholder_id is a number
-    if not isinstance(policyholder_id, int):
-        return jsonify({"error": "Policyholder ID must be a number"}), 400
 
-    # Validate that name contains only letters
-    if not name.isalpha():
-        return jsonify({"error": "Name must contain only letters"}), 400
+    error = validate_policyholder(data)
+    if error:
+        return jsonify({"error": error}), 400
 
     # Validate that policyholder_id is unique
     existing_policyholder = policyholders_collection.find_one({"policyholder_id": policyholder_id})
@@ -113,8 +124,9 @@ def update_policyholder(policyholder_id):
     data = request.json
     name = data.get("name")
 
-    if not name.isalpha():
-        return jsonify({"error": "Name must contain only letters"}), 400
+    error = validate_policyholder({**data, "policyholder_id": policyholder_id})
+    if error:
+        return jsonify({"error": error}), 400
 
     # Find policyholder by ID
     policyholder = policyholders_collection.find_one({"policyholder_id": policyholder_id})
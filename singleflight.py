@@ -0,0 +1,96 @@
+import threading
+from functools import wraps
+from urllib.parse import urlencode
+from flask import request, current_app
+from prometheus_client import Counter, Gauge
+
+# ------------------------ REQUEST COALESCING ------------------------
+# Identical concurrent GET requests share one in-flight handler call. Only the
+# query parameters a view lists in params are part of the key. The entry is
+# dropped as soon as the call finishes, so nothing is served from a result
+# older than the request that produced it.
+
+singleflight_waiters = Gauge('singleflight_waiters', 'Requests waiting on an in-flight identical request', ['key'])
+singleflight_coalesced = Counter('singleflight_coalesced_total', 'Requests served from a shared in-flight result', ['endpoint'])
+
+_lock = threading.Lock()
+_in_flight = {}
+_waiting = {}
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.body = None
+        self.status = None
+        self.headers = None
+        self.error = None
+
+
+def _request_key(params):
+    # Route plus the allowed query parameters, sorted so that ordering and
+    # unused (e.g. cache-busting) parameters do not split the key
+    values = sorted((name, value) for name in params for value in request.args.getlist(name))
+    return f"{request.method} {request.path}?{urlencode(values)}"
+
+
+def _track_waiter(key, delta):
+    # Called with _lock held; drop the series once nobody is waiting on the key
+    count = _waiting.get(key, 0) + delta
+    if count:
+        _waiting[key] = count
+        singleflight_waiters.labels(key=key).set(count)
+    else:
+        _waiting.pop(key, None)
+        try:
+            singleflight_waiters.remove(key)
+        except KeyError:
+            pass
+
+
+def single_flight(params=()):
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = _request_key(params)
+
+            with _lock:
+                call = _in_flight.get(key)
+                leader = call is None
+                if leader:
+                    call = _Call()
+                    _in_flight[key] = call
+                else:
+                    _track_waiter(key, 1)
+
+            if leader:
+                try:
+                    response = current_app.make_response(view(*args, **kwargs))
+                    call.body = response.get_data()
+                    call.status = response.status_code
+                    call.headers = list(response.headers)
+                    return response
+                except Exception as e:
+                    call.error = e
+                    raise
+                finally:
+                    with _lock:
+                        _in_flight.pop(key, None)
+                    call.done.set()
+
+            # Wait for the leader and reuse its serialized result
+            try:
+                call.done.wait()
+            finally:
+                with _lock:
+                    _track_waiter(key, -1)
+
+            if call.error is not None:
+                raise call.error
+
+            singleflight_coalesced.labels(endpoint=request.path).inc()
+            return current_app.response_class(call.body, status=call.status, headers=call.headers)
+
+        return wrapper
+
+    return decorator